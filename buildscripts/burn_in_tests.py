@@ -194,15 +194,19 @@ def create_executor_list(suites, exclude_suites):
         LOGGER.info("Getting test membership data.")
         test_membership = create_test_membership_map(test_kind=SUPPORTED_TEST_KINDS)
 
-    memberships = defaultdict(list)
+    excluded = set(exclude_suites)
+    # An insertion-ordered dict per executor dedups the tests without an O(N)
+    # list membership scan per test.
+    memberships = defaultdict(dict)
     for suite in suites:
         LOGGER.debug("Adding tests for suite", suite=suite, tests=suite.tests)
         for test in suite.tests:
             LOGGER.debug("membership for test", test=test, membership=test_membership[test])
-            for executor in set(test_membership[test]) - set(exclude_suites):
-                if test not in memberships[executor]:
-                    memberships[executor].append(test)
-    return memberships
+            for executor in set(test_membership[test]) - excluded:
+                memberships[executor][test] = None
+    return defaultdict(list,
+                       {executor: list(tests)
+                        for executor, tests in memberships.items()})
 
 
 def _get_task_name(task):
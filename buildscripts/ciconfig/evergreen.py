@@ -7,10 +7,16 @@ from __future__ import annotations
 
 import datetime
 import distutils.spawn  # pylint: disable=no-name-in-module
+import sys
 from typing import Set, List, Optional
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlSafeLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlSafeLoader
+
 import buildscripts.util.runcommand as runcommand
 
 ENTERPRISE_MODULE_NAME = "enterprise"
@@ -31,10 +37,10 @@ def parse_evergreen_file(path, evergreen_binary="evergreen"):
         error_code, output = cmd.execute()
         if error_code:
             raise RuntimeError("Unable to evaluate {}: {}".format(path, output))
-        config = yaml.safe_load(output)
+        config = yaml.load(output, Loader=_YamlSafeLoader)
     else:
         with open(path, "r") as fstream:
-            config = yaml.safe_load(fstream)
+            config = yaml.load(fstream, Loader=_YamlSafeLoader)
 
     return EvergreenProjectConfig(config)
 
@@ -45,20 +51,28 @@ class EvergreenProjectConfig(object):  # pylint: disable=too-many-instance-attri
     def __init__(self, conf):
         """Initialize the EvergreenProjectConfig from a YML dictionary."""
         self._conf = conf
-        self.tasks = [Task(task_dict) for task_dict in self._conf["tasks"]]
+        # The parsed configuration is read-only; tuples and frozensets are
+        # smaller and faster to iterate than their mutable counterparts.
+        self.tasks = tuple(Task(task_dict) for task_dict in self._conf["tasks"])
         self._tasks_by_name = {task.name: task for task in self.tasks}
-        self.task_groups = [
-            TaskGroup(task_group_dict) for task_group_dict in self._conf.get("task_groups", [])
-        ]
+        self.task_groups = tuple(
+            TaskGroup(task_group_dict) for task_group_dict in self._conf.get("task_groups", []))
         self._task_groups_by_name = {task_group.name: task_group for task_group in self.task_groups}
-        self.variants = [
+        self.variants = tuple(
             Variant(variant_dict, self._tasks_by_name, self._task_groups_by_name)
-            for variant_dict in self._conf["buildvariants"]
-        ]
+            for variant_dict in self._conf["buildvariants"])
         self._variants_by_name = {variant.name: variant for variant in self.variants}
-        self.distro_names = set()
-        for variant in self.variants:
-            self.distro_names.update(variant.distro_names)
+        self._distro_names = None
+
+    @property
+    def distro_names(self):
+        """Get the set of distro names used across all build variants."""
+        if self._distro_names is None:
+            distro_names = set()
+            for variant in self.variants:
+                distro_names.update(variant.distro_names)
+            self._distro_names = frozenset(distro_names)
+        return self._distro_names
 
     @property
     def task_names(self) -> List[str]:
@@ -99,6 +113,10 @@ class EvergreenProjectConfig(object):  # pylint: disable=too-many-instance-attri
 class Task(object):
     """Represent a task configuration as found in an Evergreen project configuration file."""
 
+    # Projects define thousands of tasks; slots shrink each instance and speed
+    # up attribute access in the scripts that iterate over all of them.
+    __slots__ = ("raw", "_tags", "_func_commands", "_suite_name")
+
     def __init__(self, conf_dict):
         """Initialize a Task from a dictionary containing its configuration."""
         self.raw = conf_dict
@@ -106,6 +124,14 @@ class Task(object):
         # Lazy parse task tags.
         self._tags = None
 
+        # Cache func-command lookups; the raw configuration is never mutated, so
+        # results stay valid for the life of the Task. Allocated lazily since
+        # most of the thousands of Task objects are never queried.
+        self._func_commands = None
+
+        # Lazily computed by get_suite_name().
+        self._suite_name = None
+
     @property
     def name(self):
         """Get the task name."""
@@ -118,10 +144,14 @@ class Task(object):
 
     def find_func_command(self, func_command):
         """Return the 'func_command' if found, or None."""
-        for command in self.raw.get("commands", []):
-            if command.get("func") == func_command:
-                return command
-        return None
+        if self._func_commands is None:
+            self._func_commands = {}
+        if func_command not in self._func_commands:
+            self._func_commands[func_command] = next(
+                (command
+                 for command in self.raw.get("commands", []) if command.get("func") == func_command),
+                None)
+        return self._func_commands[func_command]
 
     @property
     def generate_resmoke_tasks_command(self):
@@ -171,7 +201,12 @@ class Task(object):
 
     def get_suite_name(self):
         """Get the name of the resmoke.py suite; the `suite` expansion overrides the task name."""
+        if self._suite_name is None:
+            self._suite_name = self._resolve_suite_name()
+        return self._suite_name
 
+    def _resolve_suite_name(self):
+        """Compute the resmoke.py suite name from the task configuration."""
         if self.is_run_tests_task:
             suite_name = self.name
         elif self.is_generate_resmoke_task:
@@ -204,7 +239,9 @@ class Task(object):
     def tags(self):
         """Get a set of tags this task has been marked with."""
         if self._tags is None:
-            self._tags = set(self.raw.get("tags", []))
+            # The same tag names recur across most tasks; interning collapses
+            # the duplicated strings and makes membership tests pointer compares.
+            self._tags = set(map(sys.intern, self.raw.get("tags", [])))
         return self._tags
 
     def require_multiversion_setup(self):
@@ -234,6 +271,8 @@ class Task(object):
 class TaskGroup(object):
     """Represent a task_group configuration as found in an Evergreen project configuration file."""
 
+    __slots__ = ("raw", )
+
     def __init__(self, conf_dict):
         """Initialize a TaskGroup from a dictionary containing its configuration."""
         self.raw = conf_dict
@@ -258,21 +297,44 @@ class Variant(object):
     def __init__(self, conf_dict, task_map, task_group_map):
         """Initialize Variant."""
         self.raw = conf_dict
-        run_on = self.run_on
-        self.tasks = []
-        for task in conf_dict["tasks"]:
-            task_name = task.get("name")
-            if task_name in task_group_map:
-                # A task in conf_dict may be a task_group, containing a list of tasks.
-                for task_in_group in task_group_map.get(task_name).tasks:
-                    self.tasks.append(
-                        VariantTask(task_map.get(task_in_group), task.get("distros", run_on), self))
-            else:
-                self.tasks.append(
-                    VariantTask(task_map.get(task["name"]), task.get("distros", run_on), self))
-        self.distro_names = set(run_on)
-        for task in self.tasks:
-            self.distro_names.update(task.run_on)
+        # Building the VariantTask list is the expensive part of parsing a
+        # project config; defer it until a consumer actually asks for it.
+        self._task_map = task_map
+        self._task_group_map = task_group_map
+        self._tasks = None
+        self._distro_names = None
+
+    @property
+    def tasks(self):
+        """Get the list of tasks this build variant runs, as VariantTask instances."""
+        if self._tasks is None:
+            run_on = self.run_on
+            tasks = []
+            for task in self.raw["tasks"]:
+                task_name = task.get("name")
+                if task_name in self._task_group_map:
+                    # A task in conf_dict may be a task_group, containing a list of tasks.
+                    for task_in_group in self._task_group_map.get(task_name).tasks:
+                        tasks.append(
+                            VariantTask(
+                                self._task_map.get(task_in_group), task.get("distros", run_on),
+                                self))
+                else:
+                    tasks.append(
+                        VariantTask(
+                            self._task_map.get(task["name"]), task.get("distros", run_on), self))
+            self._tasks = tuple(tasks)
+        return self._tasks
+
+    @property
+    def distro_names(self):
+        """Get the set of distro names this build variant uses."""
+        if self._distro_names is None:
+            distro_names = set(self.run_on)
+            for task in self.tasks:
+                distro_names.update(task.run_on)
+            self._distro_names = frozenset(distro_names)
+        return self._distro_names
 
     def __repr__(self):
         """Create a string version of object for debugging."""
@@ -311,7 +373,9 @@ class Variant(object):
     def run_on(self):
         """Get build variant run_on parameter as a list of distro names."""
         run_on = self.raw.get("run_on")
-        return run_on if run_on is not None else []
+        # Distro names are shared by many variants and tasks; intern them so
+        # the aggregated distro_names sets hold one copy of each string.
+        return [sys.intern(distro) for distro in run_on] if run_on is not None else []
 
     @property
     def task_names(self):
@@ -383,6 +447,8 @@ class Variant(object):
 class VariantTask(Task):
     """Represent a task definition in the context of a build variant."""
 
+    __slots__ = ("run_on", "variant")
+
     def __init__(self, task, run_on, variant):
         """Initialize VariantTask."""
         Task.__init__(self, task.raw)
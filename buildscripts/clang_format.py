@@ -185,7 +185,7 @@ class ClangFormat(object):
                     os.environ["ProgramFiles(x86)"],
                 ]
 
-                directories_to_check += [os.path.join(p, "LLVM\\bin\\") for p in programfiles]
+                directories_to_check.extend(os.path.join(p, "LLVM\\bin\\") for p in programfiles)
 
             for ospath in directories_to_check:
                 for program in programs:
@@ -8,7 +8,9 @@ Optionally replaces zero codes in source code with new distinct values.
 import bisect
 import os.path
 import sys
-from collections import defaultdict, namedtuple
+from collections import defaultdict, deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from optparse import OptionParser
 from functools import reduce
 from pathlib import Path
@@ -75,29 +77,50 @@ _FILE_INCLUDE_RE = re.compile(r'.*\.(cpp|c|h|py|idl)')
 def get_all_source_files(prefix='.'):
     """Return source files."""
 
-    def walk(path):
+    # An explicit stack avoids re-yielding every file through a chain of
+    # nested generators, one per directory level.
+    pending = [Path(prefix)]
+    while pending:
+        path = pending.pop()
         for fx in path.iterdir():
             if fx.is_dir():
                 if fx.is_symlink() and fx.parent.name != "modules":
                     continue
                 if _DIR_EXCLUDE_RE.fullmatch(fx.name):
                     continue
-                for child in walk(fx):
-                    yield child
+                pending.append(fx)
             elif fx.is_file() and _FILE_INCLUDE_RE.fullmatch(fx.name):
-                yield fx
+                yield str(fx)
 
-    for child in walk(Path(prefix)):
-        yield str(child)
+
+def _read_source_file(source_file):
+    """Read the full text of a source file."""
+    with open(source_file, 'r', encoding='utf-8') as fh:
+        return fh.read()
 
 
 def foreach_source_file(callback, src_root):
-    """Invoke a callback on the text of each source file."""
-    for source_file in get_all_source_files(prefix=src_root):
-        if list_files:
-            print('scanning file: ' + source_file)
-        with open(source_file, 'r', encoding='utf-8') as fh:
-            callback(source_file, fh.read())
+    """Invoke a callback on the text of each source file.
+
+    File reads are fanned out across a thread pool since the scan is dominated
+    by I/O; callbacks are still invoked serially and in traversal order. The
+    read-ahead is bounded so that only a few file contents are held in memory
+    at a time while the (slower) callback catches up.
+    """
+    max_workers = min(8, os.cpu_count() or 1)
+    max_inflight = max_workers * 2
+    source_files = iter(get_all_source_files(prefix=src_root))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = deque((source_file, executor.submit(_read_source_file, source_file))
+                        for source_file in islice(source_files, max_inflight))
+        while pending:
+            source_file, future = pending.popleft()
+            next_file = next(source_files, None)
+            if next_file is not None:
+                pending.append((next_file, executor.submit(_read_source_file, next_file)))
+            if list_files:
+                print('scanning file: ' + source_file)
+            callback(source_file, future.result())
 
 
 def parse_source_files(callback, src_root):
@@ -265,7 +288,9 @@ def replace_bad_codes(errors, next_code_generator):  # pylint: disable=too-many-
         ln = line_num - 1
 
         with open(source_file, 'r+') as fh:
-            print("LINE_%d_BEFORE:%s" % (line_num, fh.readlines()[ln].rstrip()))
+            # Only the one line is needed, so stop reading there instead of
+            # materializing every line of the file with readlines().
+            print("LINE_%d_BEFORE:%s" % (line_num, next(islice(fh, ln, ln + 1)).rstrip()))
 
             fh.seek(0)
             text = fh.read()
@@ -276,7 +301,7 @@ def replace_bad_codes(errors, next_code_generator):  # pylint: disable=too-many-
             fh.write(text[byte_offset + 1:])
             fh.seek(0)
 
-            print("LINE_%d_AFTER :%s" % (line_num, fh.readlines()[ln].rstrip()))
+            print("LINE_%d_AFTER :%s" % (line_num, next(islice(fh, ln, ln + 1)).rstrip()))
 
 
 def coerce_to_number(ticket_value):
@@ -126,11 +126,13 @@ def output_jobs(jobs, outfile):
     """Output jobs configuration to the specified location."""
     output = {"resmoke_jobs": jobs}
 
+    # Serialize once and write the same text to both destinations.
+    output_text = yaml.dump(output, default_flow_style=False)
     if outfile:
         with open(outfile, "w") as fh:
-            yaml.dump(output, stream=fh, default_flow_style=False)
+            fh.write(output_text)
 
-    yaml.dump(output, stream=sys.stdout, default_flow_style=False)
+    sys.stdout.write(output_text)
 
 
 def main():
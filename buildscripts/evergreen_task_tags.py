@@ -117,7 +117,7 @@ def get_tasks_with_tag(evg_config, tags, filters):
     :param filters: lst of tags to filter out.
     :return: list of tasks marked with the given tag.
     """
-    return sorted([task.name for task in evg_config.tasks if is_task_tagged(task, tags, filters)])
+    return sorted(task.name for task in evg_config.tasks if is_task_tagged(task, tags, filters))
 
 
 def list_tasks_with_tag(evg_config, tags, filters):
@@ -159,11 +159,13 @@ def output_timeout(exec_timeout: timedelta, idle_timeout: Optional[timedelta],
     if idle_timeout is not None:
         output["timeout_secs"] = math.ceil(idle_timeout.total_seconds())
 
+    # Serialize once and write the same text to both destinations.
+    output_text = yaml.dump(output, default_flow_style=False)
     if output_file:
         with open(output_file, "w") as outfile:
-            yaml.dump(output, stream=outfile, default_flow_style=False)
+            outfile.write(output_text)
 
-    yaml.dump(output, stream=sys.stdout, default_flow_style=False)
+    sys.stdout.write(output_text)
 
 
 class TaskTimeoutOrchestrator:
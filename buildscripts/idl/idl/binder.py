@@ -40,6 +40,14 @@ from . import enum_types
 from . import errors
 from . import syntax
 
+# Constant value sets used by the per-type validators below. Hoisted to module
+# level so each validation call does not rebuild the literals.
+_ANY_CHAIN_BSON_TYPES = frozenset(("any", "chain"))
+_BANNED_CPP_NUMERIC_TYPES = frozenset(("char", "wchar_t", "char16_t", "char32_t", "float"))
+_ALLOWED_STD_INT_CPP_TYPES = frozenset(
+    ("std::int32_t", "std::int64_t", "std::uint32_t", "std::uint64_t"))
+_CPP_NUMERIC_WORDS = ("signed", "unsigned", "int", "long", "short")
+
 
 def _validate_single_bson_type(ctxt, idl_type, syntax_type):
     # type: (errors.ParserContext, Union[syntax.Type, ast.Type], str) -> bool
@@ -47,7 +55,7 @@ def _validate_single_bson_type(ctxt, idl_type, syntax_type):
     bson_type = idl_type.bson_serialization_type[0]
 
     # Any and Chain are only valid if they are the only bson types specified
-    if bson_type in ["any", "chain"]:
+    if bson_type in _ANY_CHAIN_BSON_TYPES:
         return True
 
     if not bson.is_valid_bson_type(bson_type):
@@ -79,7 +87,7 @@ def _validate_bson_types_list(ctxt, idl_type, syntax_type):
         return _validate_single_bson_type(ctxt, idl_type, syntax_type)
 
     for bson_type in bson_types:
-        if bson_type in ["any", "chain"]:
+        if bson_type in _ANY_CHAIN_BSON_TYPES:
             ctxt.add_bad_any_type_use_error(idl_type, bson_type, syntax_type, idl_type.name)
             return False
 
@@ -121,12 +129,12 @@ def _validate_cpp_type(ctxt, idl_type, syntax_type):
         ctxt.add_no_string_data_error(idl_type, syntax_type, idl_type.name)
 
     # We do not support C++ char and float types for style reasons
-    if idl_type.cpp_type in ['char', 'wchar_t', 'char16_t', 'char32_t', 'float']:
+    if idl_type.cpp_type in _BANNED_CPP_NUMERIC_TYPES:
         ctxt.add_bad_cpp_numeric_type_use_error(idl_type, syntax_type, idl_type.name,
                                                 idl_type.cpp_type)
 
     # We do not support C++ builtin integer for style reasons
-    for numeric_word in ['signed', "unsigned", "int", "long", "short"]:
+    for numeric_word in _CPP_NUMERIC_WORDS:
         if re.search(r'\b%s\b' % (numeric_word), idl_type.cpp_type):
             ctxt.add_bad_cpp_numeric_type_use_error(idl_type, syntax_type, idl_type.name,
                                                     idl_type.cpp_type)
@@ -134,7 +142,7 @@ def _validate_cpp_type(ctxt, idl_type, syntax_type):
             return
 
     # Check for std fixed integer types which are allowed
-    if idl_type.cpp_type in ["std::int32_t", "std::int64_t", "std::uint32_t", "std::uint64_t"]:
+    if idl_type.cpp_type in _ALLOWED_STD_INT_CPP_TYPES:
         return
 
     # Only allow 16-byte arrays since they are for MD5 and UUID
@@ -593,7 +601,7 @@ def _bind_single_check(ctxt, parsed_spec, access_check):
     ast_access_check = ast.AccessCheck(access_check.file_name, access_check.line,
                                        access_check.column)
 
-    assert bool(access_check.check) != bool(access_check.privilege)
+    assert (access_check.check is None) != (access_check.privilege is None)
 
     if access_check.check:
         ast_access_check.check = _bind_enum_value(ctxt, parsed_spec, access_check, "AccessCheck",
@@ -884,7 +892,7 @@ def _bind_expression(expr, allow_literal_string=True):
     # int32_t
     try:
         intval = int(expr.literal)
-        if intval >= -0x80000000 and intval <= 0x7FFFFFFF:  # pylint: disable=chained-comparison
+        if -0x80000000 <= intval <= 0x7FFFFFFF:
             node.expr = repr(intval)
             return node
     except ValueError:
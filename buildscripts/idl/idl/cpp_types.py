@@ -30,7 +30,7 @@
 from abc import ABCMeta, abstractmethod
 
 import textwrap
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional
 
 from . import ast
 from . import bson
@@ -544,19 +544,28 @@ def get_cpp_type_without_optional(field):
     return get_cpp_type_from_cpp_type_name(field, field.type.cpp_type, field.type.is_array)
 
 
+# The generator asks for the same field's type information from several code
+# paths (getters, setters, serializers, parsers); memoize per field object.
+_CPP_TYPE_CACHE = {}  # type: Dict[ast.Field, CppTypeBase]
+
+
 def get_cpp_type(field):
     # type: (ast.Field) -> CppTypeBase
     """Get the C++ Type information for the given field."""
 
-    cpp_type_info = get_cpp_type_without_optional(field)
+    cpp_type_info = _CPP_TYPE_CACHE.get(field)
+    if cpp_type_info is None:
+        cpp_type_info = get_cpp_type_without_optional(field)
+
+        if field.optional:
+            cpp_type_info = _CppTypeOptional(cpp_type_info, field, field.type.cpp_type)
 
-    if field.optional:
-        return _CppTypeOptional(cpp_type_info, field, field.type.cpp_type)
+        _CPP_TYPE_CACHE[field] = cpp_type_info
 
     return cpp_type_info
 
 
-class BsonCppTypeBase(object, metaclass=ABCMeta):
+class BsonCppTypeBase(metaclass=ABCMeta):
     """Base type for custom C++ support for BSON Types information."""
 
     def __init__(self, ast_type):
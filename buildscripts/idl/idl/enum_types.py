@@ -43,7 +43,7 @@ from . import syntax
 from . import writer
 
 
-class EnumTypeInfoBase(object, metaclass=ABCMeta):
+class EnumTypeInfoBase(metaclass=ABCMeta):
     """Base type for enumeration type information."""
 
     def __init__(self, idl_enum):
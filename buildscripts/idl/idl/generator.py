@@ -36,6 +36,7 @@ import re
 import sys
 import textwrap
 from abc import ABCMeta, abstractmethod
+from operator import attrgetter
 from typing import Dict, Iterable, List, Mapping, Tuple, Union
 
 from . import (ast, bson, common, cpp_types, enum_types, generic_field_list_types, struct_types,
@@ -133,10 +134,10 @@ def _get_all_fields(struct):
 
     all_fields += struct.fields
 
-    return sorted([field for field in all_fields], key=lambda f: f.cpp_name)
+    return sorted(all_fields, key=attrgetter("cpp_name"))
 
 
-class _FieldUsageCheckerBase(object, metaclass=ABCMeta):
+class _FieldUsageCheckerBase(metaclass=ABCMeta):
     """Check for duplicate fields, and required fields as needed."""
 
     def __init__(self, indented_writer):
@@ -753,7 +754,7 @@ class _CppHeaderFileWriter(_CppFileWriterBase):
             sorted_fields = sorted([
                 field
                 for field in struct.fields if (not field.ignore) and field.comparison_order != -1
-            ], key=lambda f: f.comparison_order)
+            ], key=attrgetter("comparison_order"))
             self._writer.write_line("return std::tuple({});".format(", ".join(
                 map(lambda f: "idl::relop::Ordering{{{}}}".format(_get_field_member_name(f)),
                     sorted_fields))))
@@ -2258,7 +2259,7 @@ class _CppSourceFileWriter(_CppFileWriterBase):
             sorted_fields = sorted([
                 field for field in struct.fields
                 if (not field.serialize_op_msg_request_only or include_op_msg_implicit)
-            ], key=lambda f: f.cpp_name)
+            ], key=attrgetter("cpp_name"))
 
             for field in sorted_fields:
                 self._writer.write_line(
@@ -2290,7 +2291,7 @@ class _CppSourceFileWriter(_CppFileWriterBase):
         block_name = common.template_args(
             'const stdx::unordered_map<std::string, bool> ${klass}::_genericFields {', klass=klass)
         with self._block(block_name, "};"):
-            sorted_entries = sorted(field_list.fields, key=lambda f: f.name)
+            sorted_entries = sorted(field_list.fields, key=attrgetter("name"))
             for entry in sorted_entries:
                 self._writer.write_line(
                     common.template_args(
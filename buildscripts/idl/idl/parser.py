@@ -84,6 +84,29 @@ def _has_field(
     return any(kv[0].value == field_name for kv in node.value)
 
 
+# Table-driven dispatch for _generic_parser: node_type -> (ctxt validator,
+# callable extracting the parsed value once validation passes). The validators
+# are resolved to plain function references here so the per-field hot loop does
+# a single dict lookup with no name-based attribute lookups.
+_NODE_TYPE_DISPATCH = {
+    "scalar": (errors.ParserContext.is_scalar_node, lambda ctxt, node, rule_desc: node.value),
+    "bool_scalar": (errors.ParserContext.is_scalar_bool_node,
+                    lambda ctxt, node, rule_desc: ctxt.get_bool(node)),
+    "int_scalar": (errors.ParserContext.is_scalar_non_negative_int_node,
+                   lambda ctxt, node, rule_desc: ctxt.get_non_negative_int(node)),
+    "scalar_or_sequence": (errors.ParserContext.is_scalar_sequence_or_scalar_node,
+                           lambda ctxt, node, rule_desc: rule_desc.sequence_parser_func(ctxt, node)),
+    "sequence": (errors.ParserContext.is_scalar_sequence,
+                 lambda ctxt, node, rule_desc: rule_desc.sequence_parser_func(ctxt, node)),
+    "sequence_mapping": (errors.ParserContext.is_sequence_mapping,
+                         lambda ctxt, node, rule_desc: rule_desc.sequence_parser_func(ctxt, node)),
+    "scalar_or_mapping": (errors.ParserContext.is_scalar_or_mapping_node,
+                          lambda ctxt, node, rule_desc: rule_desc.mapping_parser_func(ctxt, node)),
+    "mapping": (errors.ParserContext.is_mapping_node,
+                lambda ctxt, node, rule_desc: rule_desc.mapping_parser_func(ctxt, node)),
+}
+
+
 def _generic_parser(
         ctxt,  # type: errors.ParserContext
         node,  # type: Union[yaml.nodes.MappingNode, yaml.nodes.ScalarNode, yaml.nodes.SequenceNode]
@@ -105,38 +128,14 @@ def _generic_parser(
         if first_name in mapping_rules:
             rule_desc = mapping_rules[first_name]
 
-            if rule_desc.node_type == "scalar":
-                if ctxt.is_scalar_node(second_node, first_name):
-                    syntax_node.__dict__[first_name] = second_node.value
-            elif rule_desc.node_type == "bool_scalar":
-                if ctxt.is_scalar_bool_node(second_node, first_name):
-                    syntax_node.__dict__[first_name] = ctxt.get_bool(second_node)
-            elif rule_desc.node_type == "int_scalar":
-                if ctxt.is_scalar_non_negative_int_node(second_node, first_name):
-                    syntax_node.__dict__[first_name] = ctxt.get_non_negative_int(second_node)
-            elif rule_desc.node_type == "scalar_or_sequence":
-                if ctxt.is_scalar_sequence_or_scalar_node(second_node, first_name):
-                    syntax_node.__dict__[first_name] = rule_desc.sequence_parser_func(
-                        ctxt, second_node)
-            elif rule_desc.node_type == "sequence":
-                if ctxt.is_scalar_sequence(second_node, first_name):
-                    syntax_node.__dict__[first_name] = rule_desc.sequence_parser_func(
-                        ctxt, second_node)
-            elif rule_desc.node_type == "sequence_mapping":
-                if ctxt.is_sequence_mapping(second_node, first_name):
-                    syntax_node.__dict__[first_name] = rule_desc.sequence_parser_func(
-                        ctxt, second_node)
-            elif rule_desc.node_type == "scalar_or_mapping":
-                if ctxt.is_scalar_or_mapping_node(second_node, first_name):
-                    syntax_node.__dict__[first_name] = rule_desc.mapping_parser_func(
-                        ctxt, second_node)
-            elif rule_desc.node_type == "mapping":
-                if ctxt.is_mapping_node(second_node, first_name):
-                    syntax_node.__dict__[first_name] = rule_desc.mapping_parser_func(
-                        ctxt, second_node)
-            else:
+            dispatch = _NODE_TYPE_DISPATCH.get(rule_desc.node_type)
+            if dispatch is None:
                 raise errors.IDLError(
                     "Unknown node_type '%s' for parser rule" % (rule_desc.node_type))
+
+            validate, extract = dispatch
+            if validate(ctxt, second_node, first_name):
+                syntax_node.__dict__[first_name] = extract(ctxt, second_node, rule_desc)
         else:
             ctxt.add_unknown_node_error(first_node, syntax_node_name)
 
@@ -1074,7 +1073,7 @@ def parse_file(stream, error_file_name):
     return syntax.IDLParsedSpec(spec, None)
 
 
-class ImportResolverBase(object, metaclass=ABCMeta):
+class ImportResolverBase(metaclass=ABCMeta):
     """Base class for resolving imported files."""
 
     def __init__(self):
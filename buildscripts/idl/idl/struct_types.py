@@ -150,7 +150,7 @@ class MethodInfo(object):
                                     args=args)
 
 
-class StructTypeInfoBase(object, metaclass=ABCMeta):
+class StructTypeInfoBase(metaclass=ABCMeta):
     """Base class for struct and command code generation."""
 
     @abstractmethod
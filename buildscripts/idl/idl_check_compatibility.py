@@ -43,13 +43,13 @@ import os
 import sys
 from dataclasses import dataclass
 from enum import Enum
-from typing import Dict, List, Set, Optional, Tuple, Union
+from typing import Dict, FrozenSet, List, Set, Optional, Tuple, Union
 
 from idl import parser, syntax, errors, common
 from idl.compiler import CompilerImportResolver
 from idl_compatibility_errors import IDLCompatibilityContext, IDLCompatibilityErrorCollection
 
-ALLOW_ANY_TYPE_LIST: List[str] = [
+ALLOW_ANY_TYPE_LIST: FrozenSet[str] = frozenset([
     # This list if only used in unit-tests.
     "commandAllowedAnyTypes",
     "commandAllowedAnyTypes-param-anyTypeParam",
@@ -161,10 +161,10 @@ ALLOW_ANY_TYPE_LIST: List[str] = [
     'find-reply-invalidated',
     'getMore-reply-partialResultsReturned',
     'getMore-reply-invalidated',
-]
+])
 
 # Do not add user visible fields already released in earlier versions.
-IGNORE_UNSTABLE_LIST: List[str] = [
+IGNORE_UNSTABLE_LIST: FrozenSet[str] = frozenset([
     # The 'originalSpec' field was introduced in v5.1 behind a disabled feature flag and is not user
     # visible. This is part of the listIndexes output when executed against system.bucket.*
     # collections, which users should avoid doing.
@@ -184,21 +184,21 @@ IGNORE_UNSTABLE_LIST: List[str] = [
     # The 'runtimeConstants' field is a legacy field for internal use only and is not documented to
     # users.
     'delete-param-runtimeConstants',
-]
+])
 
-SKIPPED_FILES = [
+SKIPPED_FILES: FrozenSet[str] = frozenset([
     "unittest.idl", "mozILocalization.idl", "mozILocaleService.idl", "mozIOSPreferences.idl",
     "nsICollation.idl", "nsIStringBundle.idl", "nsIScriptableUConv.idl", "nsITextToSubURI.idl"
-]
+])
 
 # Do not add commands that were visible to users in previously released versions.
-IGNORE_COMMANDS_LIST: List[str] = [
+IGNORE_COMMANDS_LIST: FrozenSet[str] = frozenset([
     # The following commands were released behind a feature flag in 5.3 but were shelved in
     # favor of getClusterParameter and setClusterParameter. Since the feature flag was not enabled
     # in 5.3, they were effectively unusable and so can be safely removed from the strict API.
     'getChangeStreamOptions',
     'setChangeStreamOptions',
-]
+])
 
 
 class FieldCompatibility:
@@ -587,17 +587,21 @@ def check_reply_fields(ctxt: IDLCompatibilityContext, old_reply: syntax.Struct,
 
     old_reply_fields = get_all_struct_fields(old_reply, old_idl_file, old_idl_file_path)
     new_reply_fields = get_all_struct_fields(new_reply, new_idl_file, new_idl_file_path)
-    for old_field in old_reply_fields or []:
-        new_field_exists = False
-        for new_field in new_reply_fields or []:
-            if new_field.name == old_field.name:
-                new_field_exists = True
-                check_reply_field(ctxt, old_field, new_field, cmd_name, old_idl_file, new_idl_file,
-                                  old_idl_file_path, new_idl_file_path)
 
-                break
+    # Index the fields by name so matching old and new fields is O(1) per lookup
+    # instead of a linear scan per field. Keep the first occurrence of a name to
+    # match the behavior of scanning for the first match.
+    new_reply_fields_by_name: Dict[str, syntax.Field] = {}
+    for new_field in new_reply_fields or []:
+        new_reply_fields_by_name.setdefault(new_field.name, new_field)
+    old_reply_field_names = {old_field.name for old_field in old_reply_fields or []}
 
-        if not new_field_exists and not old_field.unstable:
+    for old_field in old_reply_fields or []:
+        new_field = new_reply_fields_by_name.get(old_field.name)
+        if new_field is not None:
+            check_reply_field(ctxt, old_field, new_field, cmd_name, old_idl_file, new_idl_file,
+                              old_idl_file_path, new_idl_file_path)
+        elif not old_field.unstable:
             ctxt.add_new_reply_field_missing_error(cmd_name, old_field.name, old_idl_file_path)
 
     for new_field in new_reply_fields or []:
@@ -608,12 +612,7 @@ def check_reply_fields(ctxt: IDLCompatibilityContext, old_reply: syntax.Struct,
 
         # Check that newly added fields do not have an unallowed use of 'any' as the
         # bson_serialization_type.
-        newly_added = True
-        for old_field in old_reply_fields or []:
-            if new_field.name == old_field.name:
-                newly_added = False
-
-        if newly_added:
+        if new_field.name not in old_reply_field_names:
             allow_name: str = cmd_name + "-reply-" + new_field.name
 
             new_field_type = get_field_type(new_field, new_idl_file, new_idl_file_path)
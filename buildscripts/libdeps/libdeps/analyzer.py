@@ -41,6 +41,13 @@ import networkx
 
 from libdeps.graph import CountTypes, DependsReportTypes, LinterTypes, EdgeProps, NodeProps
 
+# Enum member access and .name both go through descriptors; hoist the property
+# names used inside the per-edge and per-node analysis loops.
+EDGE_DIRECT = EdgeProps.direct.name
+EDGE_VISIBILITY = EdgeProps.visibility.name
+EDGE_SYMBOLS = EdgeProps.symbols.name
+NODE_BIN_TYPE = NodeProps.bin_type.name
+
 
 class UnsupportedAnalyzer(Exception):
     """Thrown when an analyzer is run on a graph with an unsupported schema."""
@@ -227,7 +234,7 @@ class DirectEdgeCounter(Counter):
     def run(self):
         """Count the graphs direct edges."""
 
-        return self.number_of_edge_types(EdgeProps.direct.name, True)
+        return self.number_of_edge_types(EDGE_DIRECT, True)
 
 
 class TransEdgeCounter(Counter):
@@ -243,7 +250,7 @@ class TransEdgeCounter(Counter):
     def run(self):
         """Count the graphs transitive edges."""
 
-        return self.number_of_edge_types(EdgeProps.direct.name, False)
+        return self.number_of_edge_types(EDGE_DIRECT, False)
 
 
 class DirectPubEdgeCounter(Counter):
@@ -260,8 +267,8 @@ class DirectPubEdgeCounter(Counter):
         """Count the graphs direct public edges."""
         return len([
             edge for edge in self._dependency_graph.edges(data=True)
-            if edge[2].get(EdgeProps.direct.name)
-            and edge[2].get(EdgeProps.visibility.name) == int(self.get_deptype('Public'))
+            if edge[2].get(EDGE_DIRECT)
+            and edge[2].get(EDGE_VISIBILITY) == int(self.get_deptype('Public'))
         ])
 
 
@@ -278,7 +285,7 @@ class PublicEdgeCounter(Counter):
     def run(self):
         """Count the graphs public edges."""
 
-        return self.number_of_edge_types(EdgeProps.visibility.name, int(self.get_deptype('Public')))
+        return self.number_of_edge_types(EDGE_VISIBILITY, int(self.get_deptype('Public')))
 
 
 class PrivateEdgeCounter(Counter):
@@ -294,7 +301,7 @@ class PrivateEdgeCounter(Counter):
     def run(self):
         """Count the graphs private edges."""
 
-        return self.number_of_edge_types(EdgeProps.visibility.name, int(
+        return self.number_of_edge_types(EDGE_VISIBILITY, int(
             self.get_deptype('Private')))
 
 
@@ -311,7 +318,7 @@ class InterfaceEdgeCounter(Counter):
     def run(self):
         """Count the graphs interface edges."""
 
-        return self.number_of_edge_types(EdgeProps.visibility.name,
+        return self.number_of_edge_types(EDGE_VISIBILITY,
                                          int(self.get_deptype('Interface')))
 
 
@@ -328,7 +335,7 @@ class LibCounter(Counter):
     def run(self):
         """Count the graphs lib nodes."""
 
-        return self.node_type_count(NodeProps.bin_type.name, 'SharedLibrary')
+        return self.node_type_count(NODE_BIN_TYPE, 'SharedLibrary')
 
 
 class ProgCounter(Counter):
@@ -344,7 +351,7 @@ class ProgCounter(Counter):
     def run(self):
         """Count the graphs program nodes."""
 
-        return self.node_type_count(NodeProps.bin_type.name, 'Program')
+        return self.node_type_count(NODE_BIN_TYPE, 'Program')
 
 
 def counter_factory(dependency_graph, counters, progressbar=True):
@@ -416,10 +423,8 @@ class DirectDependents(Analyzer):
     def run(self):
         """For given nodes, report what nodes depend directly on that node."""
 
-        return sorted([
-            depender for depender in self._dependents_graph[self._node]
-            if self._dependents_graph[self._node][depender].get(EdgeProps.direct.name)
-        ])
+        return sorted(depender for depender in self._dependents_graph[self._node]
+                      if self._dependents_graph[self._node][depender].get(EDGE_DIRECT))
 
     def report(self, report):
         """Add the direct depends list for this node."""
@@ -476,7 +481,7 @@ class InDegreeOne(Analyzer):
         in_degree_one_nodes = []
         for node, data in self._dependency_graph.nodes(data=True):
             if (len(self._dependents_graph[node]) < 2
-                    and data[NodeProps.bin_type.name] == 'SharedLibrary'):
+                    and data[NODE_BIN_TYPE] == 'SharedLibrary'):
 
                 if len(self._dependents_graph[node]) == 1:
                     depender = list(self._dependents_graph[node].items())[0][0]
@@ -576,10 +581,10 @@ class UnusedPublicLinter(Analyzer):
             try:
                 edge_attribs = self._dependents_graph[original_node][depender]
 
-                if (edge_attribs.get(EdgeProps.visibility.name) == int(self.get_deptype('Public'))
-                        or edge_attribs.get(EdgeProps.visibility.name) == int(
+                if (edge_attribs.get(EDGE_VISIBILITY) == int(self.get_deptype('Public'))
+                        or edge_attribs.get(EDGE_VISIBILITY) == int(
                             self.get_deptype('Interface'))):
-                    if not edge_attribs.get(EdgeProps.symbols.name):
+                    if not edge_attribs.get(EDGE_SYMBOLS):
                         if not self._tree_uses_no_symbols(depender, original_nodes, checked_edges):
                             return False
                     else:
@@ -607,12 +612,12 @@ class UnusedPublicLinter(Analyzer):
         """Check the edge against the transitive nodes for symbols."""
 
         for trans_node in self._dependency_graph[edge[0]]:
-            if (self._dependency_graph[edge[0]][trans_node].get(EdgeProps.visibility.name) == int(
+            if (self._dependency_graph[edge[0]][trans_node].get(EDGE_VISIBILITY) == int(
                     self.get_deptype('Public')) or self._dependency_graph[edge[0]][trans_node].get(
-                        EdgeProps.visibility.name) == int(self.get_deptype('Interface'))):
+                        EDGE_VISIBILITY) == int(self.get_deptype('Interface'))):
                 trans_pub_nodes.add(trans_node)
                 try:
-                    if self._dependents_graph[trans_node][edge[1]].get(EdgeProps.symbols.name):
+                    if self._dependents_graph[trans_node][edge[1]].get(EDGE_SYMBOLS):
                         return True
                 except KeyError:
                     pass
@@ -632,10 +637,10 @@ class UnusedPublicLinter(Analyzer):
         for edge in self._dependents_graph.edges:
             edge_attribs = self._dependents_graph[edge[0]][edge[1]]
 
-            if (edge_attribs.get(EdgeProps.direct.name)
-                    and edge_attribs.get(EdgeProps.visibility.name) == int(
+            if (edge_attribs.get(EDGE_DIRECT)
+                    and edge_attribs.get(EDGE_VISIBILITY) == int(
                         self.get_deptype('Public')) and self._dependents_graph.nodes()[edge[1]].get(
-                            NodeProps.bin_type.name) == 'SharedLibrary'):
+                            NODE_BIN_TYPE) == 'SharedLibrary'):
 
                 # First we will get all the transitive libdeps the dependent node
                 # induces, while we are getting those we also check if the depender
@@ -4,7 +4,7 @@ from abc import ABCMeta, abstractmethod
 from typing import Dict, List, Optional
 
 
-class LinterBase(object, metaclass=ABCMeta):
+class LinterBase(metaclass=ABCMeta):
     """Base Class for all linters."""
 
     def __init__(self, cmd_name, required_version, cmd_location=None):
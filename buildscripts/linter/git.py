@@ -1,7 +1,6 @@
 """Git Utility functions."""
 from __future__ import annotations
 
-import itertools
 import os
 from pathlib import Path
 import re
@@ -160,9 +159,9 @@ def get_files_to_check_working_tree(filter_function):
     """
     repos = get_repos()
 
-    valid_files = list(
-        itertools.chain.from_iterable(
-            [r.get_working_tree_candidates(filter_function) for r in repos]))
+    valid_files = [
+        valid_file for r in repos for valid_file in r.get_working_tree_candidates(filter_function)
+    ]
 
     return valid_files
 
@@ -177,8 +176,9 @@ def get_valid_files_from_candidates(candidates, filter_fn: Callable[[str], bool]
     """
     repos = get_repos()
 
-    valid_files = list(
-        itertools.chain.from_iterable([r.get_candidates(candidates, filter_fn) for r in repos]))
+    valid_files = [
+        valid_file for r in repos for valid_file in r.get_candidates(candidates, filter_fn)
+    ]
 
     return valid_files
 
@@ -187,8 +187,7 @@ def get_files_to_check(files, filter_function):
     # type: (List[str], Callable[[str], bool]) -> List[str]
     """Get a list of files that need to be checked based on which files are managed by git."""
     # Get a list of candidate_files
-    candidates_nested = [expand_file_string(f) for f in files]
-    candidates = list(itertools.chain.from_iterable(candidates_nested))
+    candidates = [candidate for f in files for candidate in expand_file_string(f)]
 
     if files and not candidates:
         raise ValueError("Globs '%s' did not find any files with glob." % (files))
@@ -226,8 +225,9 @@ def get_my_files_to_check(filter_function, origin_branch):
     # Get a list of candidate_files based on diff between this branch and origin/master
     repos = get_repos()
 
-    valid_files = list(
-        itertools.chain.from_iterable(
-            [r.get_my_candidate_files(filter_function, origin_branch) for r in repos]))
+    valid_files = [
+        valid_file for r in repos
+        for valid_file in r.get_my_candidate_files(filter_function, origin_branch)
+    ]
 
     return valid_files
@@ -163,10 +163,10 @@ class Repository(object):  # pylint: disable=too-many-public-methods
         """
         params = ["git", "clone"]
         if branch:
-            params += ["--branch", branch]
+            params.extend(("--branch", branch))
         if depth:
-            params += ["--depth", depth]
-        params += [url, directory]
+            params.extend(("--depth", depth))
+        params.extend((url, directory))
         result = Repository._run_process("clone", params)
         result.check_returncode()
         return Repository(directory)
@@ -12,6 +12,15 @@ from buildscripts.task_generation.constants import CONFIGURE_EVG_CREDENTIALS, DO
 LOGGER = get_logger(__name__)
 MAX_SHRUB_TASKS_FOR_SINGLE_TASK = 1000
 
+# These function calls take no vars, so every generated task can share one
+# instance instead of rebuilding identical objects per task.
+_GIT_GET_PROJECT_NO_MODULES = FunctionCall("git get project no modules")
+_ADD_GIT_TAG = FunctionCall("add git tag")
+_DO_SETUP = FunctionCall("do setup")
+_CONFIGURE_EVG_CREDENTIALS = FunctionCall(CONFIGURE_EVG_CREDENTIALS)
+_DO_MULTIVERSION_SETUP = FunctionCall(DO_MULTIVERSION_SETUP)
+_VALIDATE_RESMOKE_TESTS_RUNTIME = FunctionCall("validate resmoke tests runtime")
+
 MAX_GEN_TASKS_ERR = """
 ********************************************************************************
 It appears we are trying to generate more tasks than are supported by burn_in.
@@ -43,13 +52,13 @@ def resmoke_commands(run_tests_fn_name: str, run_tests_vars: Dict[str, Any],
 
     commands = [
         timeout_info.cmd,
-        FunctionCall("git get project no modules") if require_multiversion_setup else None,
-        FunctionCall("add git tag") if require_multiversion_setup else None,
-        FunctionCall("do setup"),
-        FunctionCall(CONFIGURE_EVG_CREDENTIALS),
-        FunctionCall(DO_MULTIVERSION_SETUP) if require_multiversion_setup else None,
+        _GIT_GET_PROJECT_NO_MODULES if require_multiversion_setup else None,
+        _ADD_GIT_TAG if require_multiversion_setup else None,
+        _DO_SETUP,
+        _CONFIGURE_EVG_CREDENTIALS,
+        _DO_MULTIVERSION_SETUP if require_multiversion_setup else None,
         FunctionCall(run_tests_fn_name, run_tests_vars),
-        FunctionCall("validate resmoke tests runtime"),
+        _VALIDATE_RESMOKE_TESTS_RUNTIME,
     ]
 
     return [cmd for cmd in commands if cmd]
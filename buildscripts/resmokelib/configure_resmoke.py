@@ -93,32 +93,41 @@ def _validate_options(parser, args):
         parser.error(str(error_msgs))
 
 
-def _validate_config(parser):  # pylint: disable=too-many-branches
-    """Do validation on the config settings."""
-
-    if _config.REPEAT_TESTS_MAX:
-        if not _config.REPEAT_TESTS_SECS:
-            parser.error("Must specify --repeatTestsSecs with --repeatTestsMax")
+# The binary version names allowed in a --mixedBinVersions specification.
+_MIXED_BIN_VERSION_NAMES = frozenset(("old", "new"))
+
+# Machine architectures on which --recordWith (UndoDB) is supported.
+_X86_MACHINES = frozenset(("i386", "i686", "x86_64"))
+
+# Interdependent constraints on the --repeatTests* options, checked in order:
+# (predicate over the config module, error message when it holds).
+_REPEAT_OPTION_RULES = (
+    (lambda c: c.REPEAT_TESTS_MAX and not c.REPEAT_TESTS_SECS,
+     "Must specify --repeatTestsSecs with --repeatTestsMax"),
+    (lambda c: c.REPEAT_TESTS_MAX and c.REPEAT_TESTS_MIN > c.REPEAT_TESTS_MAX,
+     "--repeatTestsSecsMin > --repeatTestsMax"),
+    (lambda c: c.REPEAT_TESTS_MIN and not c.REPEAT_TESTS_SECS,
+     "Must specify --repeatTestsSecs with --repeatTestsMin"),
+    (lambda c: c.REPEAT_TESTS > 1 and c.REPEAT_TESTS_SECS,
+     "Cannot specify --repeatTests and --repeatTestsSecs"),
+)
 
-        if _config.REPEAT_TESTS_MIN > _config.REPEAT_TESTS_MAX:
-            parser.error("--repeatTestsSecsMin > --repeatTestsMax")
 
-    if _config.REPEAT_TESTS_MIN and not _config.REPEAT_TESTS_SECS:
-        parser.error("Must specify --repeatTestsSecs with --repeatTestsMin")
+def _validate_config(parser):  # pylint: disable=too-many-branches
+    """Do validation on the config settings."""
 
-    if _config.REPEAT_TESTS > 1 and _config.REPEAT_TESTS_SECS:
-        parser.error("Cannot specify --repeatTests and --repeatTestsSecs")
+    for is_violated, message in _REPEAT_OPTION_RULES:
+        if is_violated(_config):
+            parser.error(message)
 
     if _config.MIXED_BIN_VERSIONS is not None:
         for version in _config.MIXED_BIN_VERSIONS:
-            if version not in set(['old', 'new']):
+            if version not in _MIXED_BIN_VERSION_NAMES:
                 parser.error("Must specify binary versions as 'old' or 'new' in format"
                              " 'version1-version2'")
 
     if _config.UNDO_RECORDER_PATH is not None:
-        if not sys.platform.startswith('linux') or platform.machine() not in [
-                "i386", "i686", "x86_64"
-        ]:
+        if not sys.platform.startswith('linux') or platform.machine() not in _X86_MACHINES:
             parser.error("--recordWith is only supported on x86 and x86_64 Linux distributions")
             return
 
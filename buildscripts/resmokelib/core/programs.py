@@ -146,8 +146,7 @@ def mongo_shell_program(  # pylint: disable=too-many-arguments,too-many-branches
     }
 
     test_data = global_vars.get("TestData", {}).copy()
-    for opt_name in shortcut_opts:
-        (opt_value, opt_default) = shortcut_opts[opt_name]
+    for opt_name, (opt_value, opt_default) in shortcut_opts.items():
         if opt_value is not None:
             test_data[opt_name] = opt_value
         elif opt_name not in test_data:
@@ -316,8 +315,8 @@ def _format_shell_vars(sb, paths, value):
     # Avoid including curly braces and colons in output so that the command invocation can be
     # copied and run through bash.
     sb.append("%s = new Object()" % bracketize(paths))
-    for subkey in value:
-        _format_shell_vars(sb, paths + [subkey], value[subkey])
+    for subkey, subvalue in value.items():
+        _format_shell_vars(sb, paths + [subkey], subvalue)
 
 
 def dbtest_program(logger, executable=None, suites=None, process_kwargs=None, **kwargs):
@@ -385,8 +384,8 @@ def _apply_kwargs(args, kwargs):
     A --flag without a value is represented with the empty string.
     """
 
-    for arg_name in kwargs:
-        arg_value = str(kwargs[arg_name])
+    for arg_name, raw_value in kwargs.items():
+        arg_value = str(raw_value)
         if arg_value:
             args.append("--%s=%s" % (arg_name, arg_value))
         else:
@@ -2,6 +2,12 @@
 from typing import List, Optional
 
 import yaml
+
+try:
+    from yaml import CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeDumper as _YamlDumper
+
 from pydantic import BaseModel
 
 from buildscripts.resmokelib import configure_resmoke
@@ -38,7 +44,7 @@ class TestDiscoverySubcommand(Subcommand):
         suite = self.suite_config.get_suite(self.suite_name)
         test_list = self.gather_tests(suite)
 
-        print(yaml.safe_dump(test_list.dict()))
+        print(yaml.dump(test_list.dict(), Dumper=_YamlDumper, default_flow_style=False))
 
     @staticmethod
     def gather_tests(suite: Suite) -> SuiteTestList:
@@ -77,7 +83,7 @@ class SuiteConfigSubcommand(Subcommand):
     def execute(self):
         """Execute the subcommand."""
         suite = self.suite_config.get_suite(self.suite_name)
-        print(yaml.safe_dump(suite.get_config()))
+        print(yaml.dump(suite.get_config(), Dumper=_YamlDumper, default_flow_style=False))
 
 
 class DiscoveryPlugin(PluginInterface):
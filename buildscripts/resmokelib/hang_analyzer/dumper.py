@@ -65,10 +65,12 @@ class Dumper(metaclass=ABCMeta):
         """
         raise NotImplementedError("dump_info must be implemented in OS-specific subclasses")
 
-    @abstractmethod
+    # The dump file extension, set by each OS-specific subclass.
+    DUMP_EXT = None
+
     def get_dump_ext(self):
         """Return the dump file extension."""
-        raise NotImplementedError("get_dump_ext must be implemented in OS-specific subclasses")
+        return self.DUMP_EXT
 
     @abstractmethod
     def _find_debugger(self, debugger):
@@ -198,9 +200,7 @@ class WindowsDumper(Dumper):
 
             self._root_logger.info("Done analyzing %s process with PID %d", pinfo.name, pid)
 
-    def get_dump_ext(self):
-        """Return the dump file extension."""
-        return "mdmp"
+    DUMP_EXT = "mdmp"
 
 
 # LLDB dumper is for MacOS X
@@ -314,9 +314,7 @@ class LLDBDumper(Dumper):
             if need_sigabrt:
                 raise DumpError(need_sigabrt)
 
-    def get_dump_ext(self):
-        """Return the dump file extension."""
-        return "core"
+    DUMP_EXT = "core"
 
     def _dump_files(self, pinfo):
         """Return a dict mapping pids to core dump filenames that this dumper can create."""
@@ -472,9 +470,7 @@ class GDBDumper(Dumper):
         self._root_logger.info("Done analyzing %s processes with PIDs %s", pinfo.name,
                                str(pinfo.pidv))
 
-    def get_dump_ext(self):
-        """Return the dump file extension."""
-        return "core"
+    DUMP_EXT = "core"
 
     @staticmethod
     def _find_gcore():
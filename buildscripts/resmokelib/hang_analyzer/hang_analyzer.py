@@ -27,7 +27,6 @@ from buildscripts.resmokelib.hang_analyzer import process
 from buildscripts.resmokelib.hang_analyzer import process_list
 from buildscripts.resmokelib.hang_analyzer.extractor import download_debug_symbols
 from buildscripts.resmokelib.plugin import PluginInterface, Subcommand
-from buildscripts.resmokelib.symbolizer import Symbolizer
 
 
 class HangAnalyzer(Subcommand):
@@ -105,6 +104,10 @@ class HangAnalyzer(Subcommand):
         # Sanitizer builds are not stripped and don't require debug symbols.
         san_options = os.environ.get("san_options", None)
         if self.task_id is not None and san_options is None:
+            # Import locally since the symbolizer pulls in the setup-multiversion
+            # dependency chain (github, evergreen, requests), which is a measurable
+            # import cost on every resmoke invocation otherwise.
+            from buildscripts.resmokelib.symbolizer import Symbolizer
             my_symbolizer = Symbolizer(self.task_id, download_symbols_only=True)
             download_debug_symbols(self.root_logger, my_symbolizer)
 
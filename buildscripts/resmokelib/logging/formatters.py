@@ -10,6 +10,11 @@ class TimestampFormatter(logging.Formatter):
     Timestamp format example: 13:27:03.246Z
     """
 
+    # (whole seconds, strftime result) of the last record formatted. Records
+    # logged within the same second reuse the string instead of re-running
+    # strftime; stored as one tuple so concurrent formatters stay consistent.
+    _strftime_cache = (None, "")
+
     def formatTime(self, record, datefmt=None):
         """Return formatted time."""
         converted_time = self.converter(record.created)
@@ -17,7 +22,10 @@ class TimestampFormatter(logging.Formatter):
         if datefmt is not None:
             return time.strftime(datefmt, converted_time)
 
-        formatted_time = time.strftime("%H:%M:%S", converted_time)
+        secs, formatted_time = self._strftime_cache
+        if secs != int(record.created):
+            formatted_time = time.strftime("%H:%M:%S", converted_time)
+            self._strftime_cache = (int(record.created), formatted_time)
         return "%s.%03dZ" % (formatted_time, record.msecs)
 
 
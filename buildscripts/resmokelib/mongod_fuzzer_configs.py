@@ -66,28 +66,30 @@ def generate_table_configs(rng):
 
 def generate_flow_control_parameters(rng):
     """Generate parameters related to flow control and returns a dictionary."""
-    configs = {}
-    configs["enableFlowControl"] = rng.choice([True, False])
-    if not configs["enableFlowControl"]:
-        return configs
+    if not rng.choice([True, False]):
+        return {"enableFlowControl": False}
 
-    configs["flowControlTargetLagSeconds"] = rng.randint(1, 1000)
-    configs["flowControlThresholdLagPercentage"] = rng.random()
-    configs["flowControlMaxSamples"] = rng.randint(1, 1000 * 1000)
-    configs["flowControlSamplePeriod"] = rng.randint(1, 1000 * 1000)
-    configs["flowControlMinTicketsPerSecond"] = rng.randint(1, 10 * 1000)
-
-    return configs
+    # Dict literals evaluate their values in order, so the rng draws happen in
+    # the same sequence as the old key-by-key assignments.
+    return {
+        "enableFlowControl": True,
+        "flowControlTargetLagSeconds": rng.randint(1, 1000),
+        "flowControlThresholdLagPercentage": rng.random(),
+        "flowControlMaxSamples": rng.randint(1, 1000 * 1000),
+        "flowControlSamplePeriod": rng.randint(1, 1000 * 1000),
+        "flowControlMinTicketsPerSecond": rng.randint(1, 10 * 1000),
+    }
 
 
 def generate_independent_parameters(rng):
     """Return a dictionary with values for each independent parameter."""
-    ret = {}
-    ret["wiredTigerCursorCacheSize"] = rng.randint(-100, 100)
-    ret["wiredTigerSessionCloseIdleTimeSecs"] = rng.randint(0, 300)
-    ret["wiredTigerConcurrentWriteTransactions"] = rng.randint(16, 256)
-    ret["wiredTigerConcurrentReadTransactions"] = rng.randint(16, 256)
-    ret["wiredTigerStressConfig"] = rng.choice([True, False])
+    ret = {
+        "wiredTigerCursorCacheSize": rng.randint(-100, 100),
+        "wiredTigerSessionCloseIdleTimeSecs": rng.randint(0, 300),
+        "wiredTigerConcurrentWriteTransactions": rng.randint(16, 256),
+        "wiredTigerConcurrentReadTransactions": rng.randint(16, 256),
+        "wiredTigerStressConfig": rng.choice([True, False]),
+    }
     if rng.choice(3 * [True] + [False]):
         # The old retryable writes format is used by other variants. Weight towards turning on the
         # new retryable writes format on in this one.
@@ -102,14 +104,9 @@ def fuzz_set_parameters(seed, user_provided_params):
     """Randomly generate mongod configurations and wiredTigerConnectionString."""
     rng = random.Random(seed)
 
-    ret = {}
-    params = [generate_flow_control_parameters(rng), generate_independent_parameters(rng)]
-    for dct in params:
-        for key, value in dct.items():
-            ret[key] = value
-
-    for key, value in utils.load_yaml(user_provided_params).items():
-        ret[key] = value
+    ret = generate_flow_control_parameters(rng)
+    ret.update(generate_independent_parameters(rng))
+    ret.update(utils.load_yaml(user_provided_params))
 
     return utils.dump_yaml(ret), generate_eviction_configs(rng), generate_table_configs(rng), \
         generate_table_configs(rng)
@@ -33,13 +33,18 @@ class Powercycle(Subcommand):
         self.parser_actions = parser_actions
         self.options = options
 
+    # Maps each parser command to the method implementing it; built once at
+    # class definition instead of on every execute() call.
+    _RUN_OPTION_FUNCS = {
+        RUN: "_exec_powercycle_main",
+        HOST_SETUP: "_exec_powercycle_host_setup",
+        SAVE_DIAG: "_exec_powercycle_save_diagnostics",
+        REMOTE_HANG_ANALYZER: "_exec_powercycle_hang_analyzer",
+    }
+
     def execute(self):
         """Execute powercycle test."""
-        return {
-            self.RUN: self._exec_powercycle_main, self.HOST_SETUP: self._exec_powercycle_host_setup,
-            self.SAVE_DIAG: self._exec_powercycle_save_diagnostics,
-            self.REMOTE_HANG_ANALYZER: self._exec_powercycle_hang_analyzer
-        }[self.options.run_option]()
+        return getattr(self, self._RUN_OPTION_FUNCS[self.options.run_option])()
 
     def _exec_powercycle_main(self):
         powercycle.main(self.parser_actions, self.options)
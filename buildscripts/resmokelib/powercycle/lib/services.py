@@ -163,9 +163,7 @@ class WindowsService(object):
             # See https://msdn.microsoft.com/en-us/library/windows/desktop/ms685996(v=vs.85).aspx
             scv_type, svc_state, svc_controls, err, svc_err, svc_cp, svc_wh = (
                 win32serviceutil.QueryServiceStatus(serviceName=self.name))
-            if svc_state in self._states:
-                return self._states[svc_state]
-            return "unknown"
+            return self._states.get(svc_state, "unknown")
         except pywintypes.error:
             return "not installed"
 
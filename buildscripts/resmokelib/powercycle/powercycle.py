@@ -792,6 +792,16 @@ def remote_handler(options, task_config, root_dir):
 
     mongo_client_opts = get_mongo_client_args(host=host, port=options.port, task_config=task_config)
 
+    # Share one MongoClient across the operations below; constructing a client per
+    # operation repeats connection setup, and pymongo reconnects transparently
+    # across mongod restarts.
+    mongo_client_cache = []
+
+    def get_mongo_client():
+        if not mongo_client_cache:
+            mongo_client_cache.append(pymongo.MongoClient(**mongo_client_opts))
+        return mongo_client_cache[0]
+
     # Perform the sequence of operations specified. If any operation fails then return immediately.
     for operation in options.remote_operations:
         ret = 0
@@ -864,7 +874,7 @@ def remote_handler(options, task_config, root_dir):
                 LOGGER.error("Failed to start mongod on port %d: %s", options.port, output)
                 return ret
             LOGGER.info("Started mongod running on port %d pid %s", options.port, mongod.get_pids())
-            mongo = pymongo.MongoClient(**mongo_client_opts)
+            mongo = get_mongo_client()
             # Limit retries to a reasonable value
             for _ in range(100):
                 try:
@@ -886,7 +896,7 @@ def remote_handler(options, task_config, root_dir):
             return wait_for_mongod_shutdown(mongod)
 
         def shutdown_mongod():
-            mongo = pymongo.MongoClient(**mongo_client_opts)
+            mongo = get_mongo_client()
             try:
                 mongo.admin.command("shutdown", force=True)
             except pymongo.errors.AutoReconnect:
@@ -907,12 +917,12 @@ def remote_handler(options, task_config, root_dir):
             return ret
 
         def seed_docs():
-            mongo = pymongo.MongoClient(**mongo_client_opts)
+            mongo = get_mongo_client()
             return mongo_seed_docs(mongo, powercycle_constants.DB_NAME,
                                    powercycle_constants.COLLECTION_NAME, task_config.seed_doc_num)
 
         def set_fcv():
-            mongo = pymongo.MongoClient(**mongo_client_opts)
+            mongo = get_mongo_client()
             try:
                 ret = mongo.admin.command("setFeatureCompatibilityVersion", task_config.fcv)
                 ret = 0 if ret["ok"] == 1 else 1
@@ -31,10 +31,7 @@ class RunHangAnalyzerOnRemoteInstance(PowercycleCommand):
         remote_dir = powercycle_constants.REMOTE_DIR
         files = self._call("ls")[1].split("\n")
         dbg_regex = re.compile(r"(\.debug$)|(\.dSYM$)|(\.pdb$)")
-        debug_files = [f for f in files if dbg_regex.match(f)]
-        file_param = []
-        for debug_file in debug_files:
-            file_param.append(debug_file)
+        file_param = [f for f in files if dbg_regex.match(f)]
         if file_param:
             self.remote_op.operation(SSHOperation.COPY_TO, file_param, remote_dir)
 
@@ -25,7 +25,6 @@ from buildscripts.resmokelib import suitesconfig
 from buildscripts.resmokelib import testing
 from buildscripts.resmokelib import utils
 from buildscripts.resmokelib.plugin import PluginInterface, Subcommand
-from buildscripts.resmokelib.run import generate_multiversion_exclude_tags
 from buildscripts.resmokelib.run import runtime_recorder
 from buildscripts.resmokelib.run import list_tags
 from buildscripts.resmokelib.run.runtime_recorder import compare_start_time
@@ -174,6 +173,9 @@ class TestRunner(Subcommand):  # pylint: disable=too-many-instance-attributes
 
     def generate_multiversion_exclude_tags(self):
         """Generate multiversion exclude tags file."""
+        # Imported here because this module drags in the GitHub API client,
+        # which is too expensive to load at every resmoke.py startup.
+        from buildscripts.resmokelib.run import generate_multiversion_exclude_tags
         generate_multiversion_exclude_tags.generate_exclude_yaml(
             config.MULTIVERSION_BIN_VERSION, config.EXCLUDE_TAGS_FILE_PATH, config.EXPANSIONS_FILE,
             self._resmoke_logger)
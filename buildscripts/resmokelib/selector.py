@@ -69,12 +69,8 @@ class TestFileExplorer(object):
         Returns:
             A list of paths as a list(str).
         """
-        tests = []
         with open(root_file_path, "r") as filep:
-            for test_path in filep:
-                test_path = test_path.strip()
-                tests.append(test_path)
-        return tests
+            return [test_path.strip() for test_path in filep]
 
     @staticmethod
     def fnmatchcase(name, pattern):
@@ -253,15 +249,19 @@ class _TestList(object):
         The tests are returned in the same order as they are found in the root tests.
         """
         tests = []
-        excluded = []
+        seen = set()
+        # An insertion-ordered dict dedups the excluded tests without the
+        # O(N) list membership scan per test.
+        excluded = {}
         for test in self._roots:
             if test in self._filtered:
-                if config.TEST_FILES or test not in tests:
+                if config.TEST_FILES or test not in seen:
                     # Allow duplicate tests if the tests were explicitly duplicated on the CLI invocation or replay file.
                     tests.append(test)
-            elif test not in excluded:
-                excluded.append(test)
-        return tests, excluded
+                    seen.add(test)
+            else:
+                excluded[test] = None
+        return tests, list(excluded)
 
 
 ##############################
@@ -514,8 +514,9 @@ class _JSTestSelector(_Selector):
     def get_tags(self, test_file):
         """Return tags from test_file."""
         file_tags = self._test_file_explorer.jstest_tags(test_file)
-        if test_file in self._tags:
-            return list(set(file_tags) | set(self._tags[test_file]))
+        extra_tags = self._tags.get(test_file)
+        if extra_tags is not None:
+            return list(set(file_tags) | set(extra_tags))
         return file_tags
 
 
@@ -1,3 +1,6 @@
 """Setup multiversion mongodb module."""
 
-from buildscripts.resmokelib.setup_multiversion.setup_multiversion import SetupMultiversionPlugin
+# Deliberately no re-exports: importing setup_multiversion.setup_multiversion
+# pulls in the evergreen, github and requests clients, which costs hundreds of
+# milliseconds at every resmoke.py startup. Consumers import the plugin from
+# the submodule directly.
@@ -7,6 +7,7 @@ enterprise builds.
 """
 from itertools import chain
 import argparse
+import functools
 import logging
 import os
 import platform
@@ -49,8 +50,14 @@ def setup_logging(debug=False):
     structlog.configure(logger_factory=structlog.stdlib.LoggerFactory())
 
 
+@functools.lru_cache(maxsize=None)
 def infer_platform(edition=None, version=None):
-    """Infer platform for popular OS."""
+    """Infer platform for popular OS.
+
+    The result only depends on the host OS and the (edition, version)
+    arguments, so it is cached to avoid re-parsing /etc/os-release via distro
+    on every call.
+    """
     syst = platform.system()
     pltf = None
     if syst == 'Darwin':
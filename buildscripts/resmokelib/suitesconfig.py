@@ -1,6 +1,8 @@
 """Module for retrieving the configuration of resmoke.py test suites."""
 import collections
+import copy
 import os
+import sys
 from threading import Lock
 from typing import Dict, List
 
@@ -13,8 +15,15 @@ from buildscripts.resmokelib.utils.dictionary import merge_dicts
 
 SuiteName = str
 
+_YAML_EXTENSIONS = frozenset((".yml", ".yaml"))
+
 _NAMED_SUITES = None
 
+# Memoized results of create_test_membership_map(), keyed by its arguments.
+# Building the map parses every suite definition, so repeat calls should not
+# pay that cost again.
+_TEST_MEMBERSHIP = {}
+
 
 def get_named_suites() -> List[SuiteName]:
     """Return a list of the suites names."""
@@ -56,6 +65,10 @@ def create_test_membership_map(fail_on_missing_selector=False, test_kind=None):
 
         test_kind = frozenset(test_kind)
 
+    cache_key = (fail_on_missing_selector, test_kind)
+    if cache_key in _TEST_MEMBERSHIP:
+        return _TEST_MEMBERSHIP[cache_key]
+
     test_membership = collections.defaultdict(list)
     for suite_name in get_named_suites():
         try:
@@ -66,7 +79,10 @@ def create_test_membership_map(fail_on_missing_selector=False, test_kind=None):
             for testfile in suite.tests:
                 if isinstance(testfile, (dict, list)):
                     continue
-                test_membership[testfile].append(suite_name)
+                # Suites glob their test lists independently, so the same path shows up
+                # as a distinct-but-equal string per suite. Interning dedupes the key
+                # objects and lets later lookups hit the identity fast path.
+                test_membership[sys.intern(testfile)].append(suite_name)
         except IOError as err:
             # We ignore errors from missing files referenced in the test suite's "selector"
             # section. Certain test suites (e.g. unittests.yml) have a dedicated text file to
@@ -76,6 +92,7 @@ def create_test_membership_map(fail_on_missing_selector=False, test_kind=None):
                 if not fail_on_missing_selector:
                     continue
             raise
+    _TEST_MEMBERSHIP[cache_key] = test_membership
     return test_membership
 
 
@@ -142,13 +159,16 @@ class ExplicitSuiteConfig(SuiteConfigInterface):
 
     _name_suites_lock = Lock()
     _named_suites = {}
+    _suite_config_cache: Dict[str, dict] = {}
 
     @classmethod
     def get_config_obj(cls, suite_name):
         """Get the suite config object in the given file."""
-        if suite_name in cls.get_named_suites():
-            # Check if is a named suite first for efficiency.
-            suite_path = cls.get_named_suites()[suite_name]
+        # Check if is a named suite first for efficiency. Look the name up once;
+        # each get_named_suites() call acquires the populate lock.
+        named_suites = cls.get_named_suites()
+        if suite_name in named_suites:
+            suite_path = named_suites[suite_name]
         elif fs.is_yaml_file(suite_name):
             # Check if is a path to a YAML file.
             if os.path.isfile(suite_name):
@@ -159,7 +179,12 @@ class ExplicitSuiteConfig(SuiteConfigInterface):
             # Not an explicit suite, return None.
             return None
 
-        return utils.load_yaml_file(suite_path)
+        # Parse each suite file at most once; every matrix suite re-reads its base
+        # suite through here. Callers mutate the returned config (e.g. matrix
+        # overrides are merged into it), so hand out a private copy.
+        if suite_path not in cls._suite_config_cache:
+            cls._suite_config_cache[suite_path] = utils.load_yaml_file(suite_path)
+        return copy.deepcopy(cls._suite_config_cache[suite_path])
 
     @classmethod
     def get_named_suites(cls) -> Dict[str, str]:
@@ -168,12 +193,11 @@ class ExplicitSuiteConfig(SuiteConfigInterface):
             if not cls._named_suites:
                 suites_dir = os.path.join(_config.CONFIG_DIR, "suites")
                 root = os.path.abspath(suites_dir)
-                files = os.listdir(root)
-                for filename in files:
-                    (short_name, ext) = os.path.splitext(filename)
-                    if ext in (".yml", ".yaml"):
-                        pathname = os.path.join(root, filename)
-                        cls._named_suites[short_name] = pathname
+                with os.scandir(root) as entries:
+                    for entry in entries:
+                        (short_name, ext) = os.path.splitext(entry.name)
+                        if ext in _YAML_EXTENSIONS:
+                            cls._named_suites[short_name] = entry.path
 
             return cls._named_suites
 
@@ -295,12 +319,12 @@ class MatrixSuiteConfig(SuiteConfigInterface):
     def __get_suite_files_in_dir(cls, target_dir):
         """Get the physical files defining these suites for parsing comments."""
         root = os.path.abspath(target_dir)
-        files = os.listdir(root)
         all_files = {}
-        for filename in files:
-            (short_name, ext) = os.path.splitext(filename)
-            if ext in (".yml", ".yaml"):
-                all_files[short_name] = os.path.join(root, filename)
+        with os.scandir(root) as entries:
+            for entry in entries:
+                (short_name, ext) = os.path.splitext(entry.name)
+                if ext in _YAML_EXTENSIONS:
+                    all_files[short_name] = entry.path
 
         return all_files
 
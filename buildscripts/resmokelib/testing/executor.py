@@ -324,10 +324,14 @@ class TestQueue(_queue.Queue):
         super().__init__()
 
     def add_test_cases(self, test_cases: List[QueueElem]) -> None:
-        """Add test cases to the queue."""
-        for test_case in test_cases:
-            if self.max_test_queue_size < 0 or self.num_tests < self.max_test_queue_size:
-                self.put(test_case)
-                self.num_tests += 1
-            else:
-                break
+        """Add test cases to the queue in a single batch."""
+        if self.max_test_queue_size >= 0:
+            test_cases = test_cases[:max(self.max_test_queue_size - self.num_tests, 0)]
+
+        # Extend the underlying deque under one lock acquisition rather than
+        # paying a mutex round trip and consumer wakeup per put() call.
+        with self.mutex:
+            self.queue.extend(test_cases)
+            self.unfinished_tasks += len(test_cases)
+            self.not_empty.notify_all()
+        self.num_tests += len(test_cases)
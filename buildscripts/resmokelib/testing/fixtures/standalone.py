@@ -355,8 +355,7 @@ class MongodLauncher(object):
                                             24 * 60 * 60)  # 24 hours
 
         # Command line options override the YAML configuration.
-        for opt_name in shortcut_opts:
-            opt_value = shortcut_opts[opt_name]
+        for opt_name, opt_value in shortcut_opts.items():
             if opt_name in opts_without_vals:
                 # Options that are specified as --flag on the command line are represented by a boolean
                 # value where True indicates that the flag should be included in 'kwargs'.
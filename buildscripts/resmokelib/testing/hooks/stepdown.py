@@ -133,8 +133,7 @@ class ContinuousStepdown(interface.Hook):  # pylint: disable=too-many-instance-a
             if self._config_stepdown:
                 self._add_fixture(fixture.configsvr)
             if self._wait_for_mongos_retarget:
-                for mongos_fixture in fixture.mongos:
-                    self._mongos_fixtures.append(mongos_fixture)
+                self._mongos_fixtures.extend(fixture.mongos)
         elif isinstance(fixture, tenant_migration.TenantMigrationFixture):
             if not fixture.all_nodes_electable:
                 raise ValueError(
@@ -423,10 +423,9 @@ class _TenantMigrationThread(threading.Thread):  # pylint: disable=too-many-inst
             self._wait_for_migration_garbage_collection(migration_opts)
 
             if not res["ok"]:
-                raise errors.ServerFailure("Tenant migration '" + str(migration_opts.migration_id) +
-                                           "' with donor replica set '" +
-                                           migration_opts.get_donor_name() + "' failed: " +
-                                           str(res))
+                raise errors.ServerFailure(
+                    f"Tenant migration '{migration_opts.migration_id}' with donor replica set"
+                    f" '{migration_opts.get_donor_name()}' failed: {res}")
 
             if is_committed:
                 return True
@@ -437,10 +436,9 @@ class _TenantMigrationThread(threading.Thread):  # pylint: disable=too-many-inst
                     "Tenant migration '%s' with donor replica set '%s' aborted due to failpoint: " +
                     "%s.", migration_opts.migration_id, migration_opts.get_donor_name(), str(res))
                 return False
-            raise errors.ServerFailure("Tenant migration '" + str(migration_opts.migration_id) +
-                                       "' with donor replica set '" +
-                                       migration_opts.get_donor_name() +
-                                       "' aborted due to an error: " + str(res))
+            raise errors.ServerFailure(
+                f"Tenant migration '{migration_opts.migration_id}' with donor replica set"
+                f" '{migration_opts.get_donor_name()}' aborted due to an error: {res}")
         except pymongo.errors.PyMongoError:
             self.logger.exception(
                 "Error running tenant migration '%s' with donor primary on replica set '%s'.",
@@ -18,6 +18,8 @@ def queue_elem_factory(testcase, test_config, suite_options):
 class QueueElem(object):
     """Base class for an element on the queue."""
 
+    __slots__ = ("testcase", "test_config")
+
     def __init__(self, testcase, test_config, _):
         """
         Initialize QueueElemRepeatNum class.
@@ -46,6 +48,9 @@ class QueueElem(object):
 class QueueElemRepeatTime(QueueElem):
     """Queue element for repeat time."""
 
+    __slots__ = ("repeat_num_min", "repeat_num_max", "repeat_secs", "repeat_time_elapsed",
+                 "repeat_num")
+
     def __init__(self, testcase, config, suite_options):
         """Initialize QueueElemRepeatTime class."""
         super(QueueElemRepeatTime, self).__init__(testcase, config, suite_options)
@@ -94,13 +94,18 @@ class TestReport(unittest.TestResult):  # pylint: disable=too-many-instance-attr
 
                     combined_report.test_infos.append(test_info)
 
-                combined_report.num_dynamic += report.num_dynamic
+                    # Tally the status while we are merging rather than
+                    # re-scanning the combined list once per status.
+                    if test_info.status == "pass":
+                        combined_report.num_succeeded += 1
+                    elif test_info.status == "fail":
+                        combined_report.num_failed += 1
+                    elif test_info.status == "error":
+                        combined_report.num_errored += 1
+                    elif test_info.status == "timeout":
+                        combined_report.num_interrupted += 1
 
-        # Recompute number of success, failures, and errors.
-        combined_report.num_succeeded = len(combined_report.get_successful())
-        combined_report.num_failed = len(combined_report.get_failed())
-        combined_report.num_errored = len(combined_report.get_errored())
-        combined_report.num_interrupted = len(combined_report.get_interrupted())
+                combined_report.num_dynamic += report.num_dynamic
 
         return combined_report
 
@@ -347,11 +352,16 @@ class TestReport(unittest.TestResult):  # pylint: disable=too-many-instance-attr
             if is_dynamic:
                 report.num_dynamic += 1
 
-        # Update cached values for number of successful and failed tests.
-        report.num_failed = len(report.get_failed())
-        report.num_errored = len(report.get_errored())
-        report.num_interrupted = len(report.get_interrupted())
-        report.num_succeeded = len(report.get_successful())
+            # Update the cached status counters inline rather than re-scanning
+            # the accumulated test_infos list once per status afterwards.
+            if test_info.status == "pass":
+                report.num_succeeded += 1
+            elif test_info.status == "fail":
+                report.num_failed += 1
+            elif test_info.status == "error":
+                report.num_errored += 1
+            elif test_info.status == "timeout":
+                report.num_interrupted += 1
 
         return report
 
@@ -384,6 +394,10 @@ class TestReport(unittest.TestResult):  # pylint: disable=too-many-instance-attr
 class TestInfo(object):  # pylint: disable=too-many-instance-attributes
     """Holder for the test status and timing information."""
 
+    __slots__ = ("test_id", "test_file", "group_id", "display_test_name", "dynamic", "start_time",
+                 "end_time", "status", "evergreen_status", "return_code", "log_info",
+                 "url_endpoint")
+
     def __init__(self, test_id, test_file, dynamic):
         """Initialize the TestInfo instance."""
 
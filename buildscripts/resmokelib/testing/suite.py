@@ -409,8 +409,5 @@ class Suite(object):  # pylint: disable=too-many-instance-attributes,too-many-pu
         :return: List of names of testcases.
         """
 
-        test_case_names = []
-        for _ in range(self.get_num_times_to_repeat_tests()):
-            for test_name in self.tests:
-                test_case_names.append(test_name)
-        return test_case_names
+        # A single list repetition avoids a Python-level append per test name.
+        return list(self.tests) * self.get_num_times_to_repeat_tests()
@@ -35,6 +35,5 @@ class SDAMJsonTestCase(interface.ProcessTestCase):
 
     def _make_process(self):
         command_line = [self.program_executable]
-        command_line += ["--source-dir", self.TEST_DIR]
-        command_line += ["-f", self.json_test_file]
+        command_line.extend(("--source-dir", self.TEST_DIR, "-f", self.json_test_file))
         return core.programs.make_process(self.logger, command_line, **self.program_options)
@@ -1,7 +1,6 @@
 """Interactions with the undodb tool-suite."""
 
 from buildscripts.resmokelib.plugin import PluginInterface, Subcommand
-from . import fetch
 
 _HELP = """
 Info on how to install undodb.
@@ -61,6 +60,9 @@ class UndoDbPlugin(PluginInterface):
         if subcommand != _COMMAND:
             return None
         if parsed_args.fetch:
+            # Imported here because fetch pulls in the Evergreen API client,
+            # which is too expensive to load at every resmoke.py startup.
+            from . import fetch
             return fetch.Fetch(parsed_args.fetch)
 
         return UndoDb()
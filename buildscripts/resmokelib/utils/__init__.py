@@ -6,6 +6,13 @@ import sys
 
 import yaml
 
+try:
+    # Prefer the libyaml-backed C implementations; suite configuration files
+    # are parsed in bulk and the pure-Python loader dominates startup time.
+    from yaml import CSafeDumper as _YamlSafeDumper, CSafeLoader as _YamlSafeLoader
+except ImportError:
+    from yaml import SafeDumper as _YamlSafeDumper, SafeLoader as _YamlSafeLoader
+
 from buildscripts.resmokelib.utils import archival
 
 
@@ -32,11 +39,9 @@ def open_or_use_stdout(filename):
 
 def default_if_none(*values):
     """Return the first argument that is not 'None'."""
-    for value in values:
-        if value is not None:
-            return value
-
-    return None
+    # Keep the varargs signature: fixturelib forwards arbitrary argument lists
+    # here and the fixture builders pass chains of three fallbacks.
+    return next((value for value in values if value is not None), None)
 
 
 def is_windows():
@@ -53,7 +58,7 @@ def load_yaml_file(filename):
     """Attempt to read 'filename' as YAML."""
     try:
         with open(filename, "r") as fp:
-            return yaml.safe_load(fp)
+            return yaml.load(fp, Loader=_YamlSafeLoader)
     except yaml.YAMLError as err:
         raise ValueError("File '%s' contained invalid YAML: %s" % (filename, err))
 
@@ -62,7 +67,7 @@ def dump_yaml_file(value, filename):
     """Attempt to write YAML object to filename."""
     try:
         with open(filename, "w") as fp:
-            return yaml.safe_dump(value, fp)
+            return yaml.dump(value, fp, Dumper=_YamlSafeDumper)
     except yaml.YAMLError as err:
         raise ValueError("Could not write YAML to file '%s': %s" % (filename, err))
 
@@ -70,13 +75,13 @@ def dump_yaml_file(value, filename):
 def dump_yaml(value):
     """Return 'value' formatted as YAML."""
     # Use block (indented) style for formatting YAML.
-    return yaml.safe_dump(value, default_flow_style=False).rstrip()
+    return yaml.dump(value, Dumper=_YamlSafeDumper, default_flow_style=False).rstrip()
 
 
 def load_yaml(value):
     """Attempt to parse 'value' as YAML."""
     try:
-        return yaml.safe_load(value)
+        return yaml.load(value, Loader=_YamlSafeLoader)
     except yaml.YAMLError as err:
         raise ValueError("Attempted to parse invalid YAML value '%s': %s" % (value, err))
 
@@ -9,6 +9,7 @@ import tarfile
 import tempfile
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 import math
 
@@ -44,16 +45,50 @@ def file_list_size(files):
 
 
 def directory_size(directory):
-    """Return size (in bytes) of files in 'directory' tree."""
+    """Return size (in bytes) of files in 'directory' tree.
+
+    Top-level subtrees are walked on separate threads since the traversal is
+    dominated by directory-read syscalls.
+    """
     dir_bytes = 0
-    for root_dir, _, files in os.walk(str(directory)):
-        for name in files:
-            full_name = os.path.join(root_dir, name)
-            try:
-                dir_bytes += os.path.getsize(full_name)
-            except OSError:
-                # A file might be deleted while we are looping through the os.walk() result.
-                pass
+    subtrees = []
+    try:
+        with os.scandir(str(directory)) as dir_entries:
+            for dir_entry in dir_entries:
+                try:
+                    if dir_entry.is_dir(follow_symlinks=False):
+                        subtrees.append(dir_entry.path)
+                    else:
+                        # Reuse the stat result cached by scandir() instead of issuing
+                        # a separate stat syscall per file.
+                        dir_bytes += dir_entry.stat(follow_symlinks=False).st_size
+                except OSError:
+                    # A file might be deleted while we are looping through the scandir() result.
+                    pass
+    except OSError:
+        pass
+    if subtrees:
+        with ThreadPoolExecutor(max_workers=min(len(subtrees), os.cpu_count() or 1)) as executor:
+            dir_bytes += sum(executor.map(_subtree_size, subtrees))
+    return dir_bytes
+
+
+def _subtree_size(directory):
+    """Return size (in bytes) of files in 'directory' tree, walked serially."""
+    dir_bytes = 0
+    try:
+        with os.scandir(directory) as dir_entries:
+            for dir_entry in dir_entries:
+                try:
+                    if dir_entry.is_dir(follow_symlinks=False):
+                        dir_bytes += _subtree_size(dir_entry.path)
+                    else:
+                        dir_bytes += dir_entry.stat(follow_symlinks=False).st_size
+                except OSError:
+                    # A file might be deleted while we are looping through the scandir() result.
+                    pass
+    except OSError:
+        pass
     return dir_bytes
 
 
@@ -23,7 +23,9 @@ SCHEMA_VERSION = "0.1"
 
 def make_historic(obj):
     """Convert a python object into a corresponding Historic."""
-    if isinstance(obj, ALLOWED_TYPES):
+    # Exact-type check first: it is a single hash lookup, whereas isinstance
+    # walks the MRO, and nearly every value stored is a plain primitive.
+    if type(obj) in _PRIMITIVE_TYPES or isinstance(obj, ALLOWED_TYPES):
         return obj
     obj_class = _HISTORICS[type(obj).__name__]
     return obj_class.from_python_obj(obj)
@@ -122,6 +124,10 @@ class Subscriber:
 # 2. Dictionaries are allowed to be passed in but are implicitly converted to Historic.
 ALLOWED_TYPES = (bool, int, float, str, type(None), Historic)
 
+# The primitive subset of ALLOWED_TYPES, for exact-type fast paths on hot
+# validation checks.
+_PRIMITIVE_TYPES = frozenset((bool, int, float, str, type(None)))
+
 
 class HistoryDict(MutableMapping, Historic):  # pylint: disable=too-many-ancestors
     """
@@ -159,8 +165,8 @@ class HistoryDict(MutableMapping, Historic):  # pylint: disable=too-many-ancesto
             raise ValueError(
                 f"Invalid schema version. Expected {SCHEMA_VERSION} but found {schema_version}.")
         history_dict = raw_dict["History"]
-        for key in history_dict:
-            for raw_access in history_dict[key]:
+        for key, raw_accesses in history_dict.items():
+            for raw_access in raw_accesses:
                 access = Access.from_dict(raw_access)
                 self._history_store[key].append(access)
                 self._global_time = max(access.time, self._global_time)
@@ -177,9 +183,9 @@ class HistoryDict(MutableMapping, Historic):  # pylint: disable=too-many-ancesto
         # We can't safe_dump python objects, so we convert the whole store
         # to yaml-able data. (We assume the stored contents are yaml-able.)
         dumpable = dict()
-        for key in self._history_store:
+        for key, accesses in self._history_store.items():
             dumpable[key] = list()
-            for access in self._history_store[key]:
+            for access in accesses:
                 access_dict = access.as_dict()
                 if include_location:
                     access_dict["location"] = PipeLiteral(access_dict["location"])
@@ -244,7 +250,7 @@ class HistoryDict(MutableMapping, Historic):  # pylint: disable=too-many-ancesto
             raise ValueError("HistoryDict can only be converted from dict python objects.")
         history_dict = HistoryDict()
         for key, value in obj.items():
-            history_dict[key] = make_historic(value)
+            history_dict._set_validated(key, make_historic(value))  # pylint: disable=protected-access
         return history_dict
 
     def accept_write(self, key):
@@ -262,7 +268,7 @@ class HistoryDict(MutableMapping, Historic):  # pylint: disable=too-many-ancesto
         history_dict._global_time = self._global_time  # pylint: disable=protected-access
         history_dict._history_store = copy.deepcopy(self._history_store)  # pylint: disable=protected-access
         for key, value in self.items():
-            history_dict[key] = make_historic(value)
+            history_dict._set_validated(key, value)  # pylint: disable=protected-access
         return history_dict
 
     def __getitem__(self, key):
@@ -277,7 +283,7 @@ class HistoryDict(MutableMapping, Historic):  # pylint: disable=too-many-ancesto
         if isinstance(value, dict):
             value = make_historic(value)
 
-        if not isinstance(value, ALLOWED_TYPES):
+        if type(value) not in _PRIMITIVE_TYPES and not isinstance(value, ALLOWED_TYPES):
             raise ValueError(f"HistoryDict cannot store type {type(value)}."
                              " Please use a different type or create a Historic wrapper.")
         self._record_write(key, value)
@@ -287,6 +293,19 @@ class HistoryDict(MutableMapping, Historic):  # pylint: disable=too-many-ancesto
 
         self.notify_subscriber_write()
 
+    def _set_validated(self, key, value):
+        """Store a value known to be an allowed type, skipping __setitem__'s checks.
+
+        Internal fast path for copy() and from_python_obj(), whose values have
+        already passed validation (or come straight from make_historic).
+        """
+        self._record_write(key, value)
+        self._value_store[key] = value
+        if isinstance(value, HistoryDict):
+            value.subscribe(self, key)
+
+        self.notify_subscriber_write()
+
     def __delitem__(self, key):
         self._record_delete(key)
         if isinstance(self._value_store[key], Historic):
@@ -6,6 +6,13 @@ import inject
 import structlog
 import yaml
 
+try:
+    # Use the libyaml C emitter when available; it is several times faster than
+    # the pure-Python emitter on the large generated suite configs.
+    from yaml import CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeDumper as _YamlDumper
+
 import buildscripts.resmokelib.parser as _parser
 import buildscripts.resmokelib.suitesconfig as _suiteconfig
 from buildscripts.task_generation.generated_config import GeneratedFile
@@ -128,5 +135,5 @@ def generate_resmoke_suite_config(source_config, source_file, roots=None, exclud
     suite_config = update_suite_config(deepcopy(source_config), roots, excludes)
 
     contents = HEADER_TEMPLATE.format(file=__file__, suite_file=source_file)
-    contents += yaml.safe_dump(suite_config, default_flow_style=False)
+    contents += yaml.dump(suite_config, Dumper=_YamlDumper, default_flow_style=False)
     return contents
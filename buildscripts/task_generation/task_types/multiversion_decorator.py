@@ -26,6 +26,14 @@ class _SuiteFixtureType:
     OTHER = "other"
 
 
+_VERSIONS_COMBINATIONS = {
+    _SuiteFixtureType.SHELL: [""],
+    _SuiteFixtureType.SHARD: ["new_old_old_new"],
+    _SuiteFixtureType.REPL: ["new_new_old", "new_old_new", "old_new_new"],
+    _SuiteFixtureType.OTHER: [""],
+}
+
+
 class MultiversionDecoratorParams(NamedTuple):
     """Parameters for converting tasks into multiversion tasks."""
 
@@ -171,12 +179,7 @@ class MultiversionGenTaskDecorator:
 
     @staticmethod
     def _get_versions_combinations(fixture_type: str) -> List[str]:
-        return {
-            _SuiteFixtureType.SHELL: [""],
-            _SuiteFixtureType.SHARD: ["new_old_old_new"],
-            _SuiteFixtureType.REPL: ["new_new_old", "new_old_new", "old_new_new"],
-            _SuiteFixtureType.OTHER: [""],
-        }[fixture_type]
+        return _VERSIONS_COMBINATIONS[fixture_type]
 
     @staticmethod
     def _build_name(base_name: str, old_version: str, mixed_bin_versions: str) -> str:
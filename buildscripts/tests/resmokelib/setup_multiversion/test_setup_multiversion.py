@@ -13,6 +13,11 @@ from buildscripts.resmokelib.setup_multiversion.setup_multiversion import SetupM
 
 
 class TestInferPlatform(unittest.TestCase):
+    def setUp(self):
+        # infer_platform memoizes its result per (edition, version); clear it so
+        # the mocked platform.system()/distro answers don't leak between tests.
+        infer_platform.cache_clear()
+
     @patch("platform.system")
     def test_infer_platform_darwin(self, mock_system):
         mock_system.return_value = 'Darwin'
@@ -67,6 +72,8 @@ class TestInferPlatform(unittest.TestCase):
         pltf = infer_platform(None, None)
         self.assertEqual(pltf, 'ubuntu1804')
 
+        # Same arguments, different mocked distro; drop the memoized answers.
+        infer_platform.cache_clear()
         mock_id.return_value = 'rhel'
         mock_major.return_value = '8'
         mock_minor.return_value = '0'
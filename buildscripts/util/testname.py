@@ -1,6 +1,7 @@
 """Functions for working with resmoke test names."""
 
 import os
+from functools import lru_cache
 
 HOOK_DELIMITER = ":"
 
@@ -10,10 +11,14 @@ def is_resmoke_hook(test_name):
     return test_name.find(HOOK_DELIMITER) != -1
 
 
+@lru_cache(maxsize=None)
 def split_test_hook_name(hook_name):
     """
     Split a hook name into the test name and the resmoke hook name.
 
+    The result is memoized because historic test stats query the test and hook
+    halves of the same immutable hook id many times per task.
+
     Note: This method uses ':' to separate the test name from the resmoke hook name. If the test
     name has a ':' in it (such as burn_in_test.py tests), it will not work correctly.
     """
@@ -1,8 +1,9 @@
 """Utility to support parsing a TestStat."""
+import sys
 from collections import defaultdict
 from dataclasses import dataclass
-from itertools import chain
 from json import JSONDecodeError
+from operator import attrgetter
 
 from typing import NamedTuple, List, Callable, Optional
 import requests
@@ -53,6 +54,8 @@ class _RuntimeHistory:
     num_runs: Number of test runs seen.
     """
 
+    __slots__ = ("duration", "num_runs")
+
     duration: float
     num_runs: int
 
@@ -74,7 +77,10 @@ class _RuntimeHistory:
 
 def normalize_test_name(test_name: str) -> str:
     """Normalize test names that may have been run on windows or unix."""
-    return test_name.replace("\\", "/")
+    # Normalized names are compared and used as set/dict keys when matching
+    # historic stats against the suite's test list; interning lets those
+    # lookups hit the identity fast path.
+    return sys.intern(test_name.replace("\\", "/"))
 
 
 def _average(value_a: float, num_a: int, value_b: float, num_b: int) -> float:
@@ -204,9 +210,10 @@ class HistoricTaskData(object):
         :return: Historic task data from the list of stats.
         """
         hooks = defaultdict(list)
-        for hook in [stat for stat in historical_test_data if is_resmoke_hook(stat.test_name)]:
-            historical_hook = HistoricHookInfo.from_test_stats(hook)
-            hooks[historical_hook.test_name()].append(historical_hook)
+        for stat in historical_test_data:
+            if is_resmoke_hook(stat.test_name):
+                historical_hook = HistoricHookInfo.from_test_stats(stat)
+                hooks[historical_hook.test_name()].append(historical_hook)
 
         return cls([
             HistoricTestInfo.from_test_stats(stat,
@@ -221,13 +228,14 @@ class HistoricTaskData(object):
                         runtime=test_stats.total_test_runtime())
             for test_stats in self.historic_test_results
         ]
-        return sorted(tests, key=lambda x: x.runtime, reverse=True)
+        return sorted(tests, key=attrgetter("runtime"), reverse=True)
 
     def get_avg_hook_runtime(self, hook_name: str) -> float:
         """Get the average runtime for the specified hook."""
-        hook_instances = list(
-            chain.from_iterable([[hook for hook in test.hooks if hook.hook_name() == hook_name]
-                                 for test in self.historic_test_results]))
+        hook_instances = [
+            hook for test in self.historic_test_results for hook in test.hooks
+            if hook.hook_name() == hook_name
+        ]
 
         if not hook_instances:
             return 0